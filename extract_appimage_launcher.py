@@ -3,26 +3,275 @@
 import os
 import re
 import shutil
+import struct
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Dict, List, Optional, Tuple
+
+# Optional faster engines for the name-cleaning patterns: pyre2 runs the big
+# noise alternation as a linear-time DFA and `regex` is a faster drop-in.
+# Not every module named re2 is re-compatible though - google-re2 installs one
+# with no IGNORECASE and an Options-based compile - so an engine is only
+# adopted if the patterns actually compile on it; stdlib re is the fallback
+try:
+    import re2 as _name_re
+except ImportError:
+    try:
+        import regex as _name_re
+    except ImportError:
+        _name_re = re
+
+# Matches the themed icon directories we used to probe individually, e.g.
+# usr/share/icons/hicolor/256x256/apps. Used to rank candidates found by the
+# single directory walk in find_best_icon.
+_ICON_DIR_RE = re.compile(r'usr/share/icons/(hicolor|Humanity|breeze|Adwaita)/(scalable|\d+x\d+)/')
+
+# Ranking tables for find_best_icon, built once: preferred themes, prioritized
+# icon sizes (from best to acceptable), and preferred file formats
+_THEME_RANKS = {theme: i for i, theme in enumerate(["hicolor", "Humanity", "breeze", "Adwaita"])}
+_SIZE_RANKS = {
+    size: i
+    for i, size in enumerate(["scalable", "512x512", "256x256", "128x128", "64x64", "48x48", "32x32", "16x16"])
+}
+_EXT_RANKS = {'.svg': 0, '.png': 1, '.jpg': 2, '.jpeg': 2, '.ico': 3}
+
+# Patterns used by clean_app_name, compiled once at import time on the best
+# available engine.
+# More comprehensive version pattern
+_VERSION_PATTERN = r'[-_.]?v?\d+(\.\d+)+([-_.]?\w+)*'
+# Date pattern (YYYYMMDD, YYYY-MM-DD, YYYY.MM.DD)
+_DATE_PATTERN = r'[-_.]?\d{4}[-_.]?\d{2}[-_.]?\d{2}'
+# Expanded pattern for architecture, OS, distribution, type, build tags etc.
+_NOISE_PATTERN = (
+    r'[-_.](x86[_-]?64|amd64|x64|i\d86|i386|i686|armv\dl|armhf|arm64|aarch64|'
+    r'linux|macos|windows|win32|win64|AppImage|portable|deb|rpm|snap|flatpak|'
+    r'setup|installer|bundle|build|release|stable|beta|alpha|rc\d*)\b'
+)
+# Sequences of non-alphanumeric chars, collapsed to a single hyphen
+_NONALNUM_PATTERN = r'[^a-zA-Z0-9]+'
+
+def _compile_name_patterns(engine):
+    """
+    Compile the name-cleaning patterns on a regex engine.
+
+    Args:
+        engine: Module exposing the stdlib re API (compile, IGNORECASE)
+
+    Returns:
+        Tuple of compiled (version, date, noise, non-alphanumeric) patterns
+    """
+    return (
+        engine.compile(_VERSION_PATTERN, engine.IGNORECASE),
+        engine.compile(_DATE_PATTERN),
+        engine.compile(_NOISE_PATTERN, engine.IGNORECASE),
+        engine.compile(_NONALNUM_PATTERN),
+    )
+
+try:
+    _VERSION_RE, _DATE_RE, _NOISE_RE, _NONALNUM_RE = _compile_name_patterns(_name_re)
+except Exception:
+    # The optional engine doesn't speak the re API; degrade to stdlib
+    _name_re = re
+    _VERSION_RE, _DATE_RE, _NOISE_RE, _NONALNUM_RE = _compile_name_patterns(re)
+
+# Classifies a stripped .desktop line in one compiled-regex match: section
+# header, Icon/Exec entry to rewrite, or key to drop entirely
+_LINE_RE = re.compile(
+    rb'\[(?P<header>[^\]]*)\]$'
+    rb'|(?P<icon>Icon=)'
+    rb'|(?P<exec>Exec=)'
+    rb'|(?P<skip>X-AppImage-Version=|Actions=|TryExec=)'
+)
+
+# First four bytes of recognized .DirIcon image formats -> file extension
+_MAGIC = {
+    b'\x89PNG': '.png',
+    b'\xff\xd8\xff\xdb': '.jpg',
+    b'\xff\xd8\xff\xe0': '.jpg',
+    b'\xff\xd8\xff\xe1': '.jpg',
+    b'\xff\xd8\xff\xee': '.jpg',
+    b'<?xm': '.svg',
+    b'<svg': '.svg',
+    b'<!DO': '.svg',
+}
+
+# Home-derived paths used in the generated launcher entries, resolved once
+# (Path.home() consults the passwd database on every call)
+_HOME = Path.home()
+_APPIMAGE_DIR = _HOME / "AppImage"
+_APPIMAGE_DIR_STR = str(_APPIMAGE_DIR)
+
+# The only squashfs entries we ever look at: .desktop files plus every icon
+# location probed by find_best_icon, including root-level image files (the
+# canonical AppDir layout keeps the icon at the root with .DirIcon a symlink
+# to it)
+_UNSQUASHFS_INCLUDES = [
+    "*.desktop",
+    ".DirIcon",
+    "*.png",
+    "*.svg",
+    "*.jpg",
+    "*.jpeg",
+    "*.ico",
+    "usr/share/applications",
+    "usr/local/share/applications",
+    "usr/share/icons",
+    "usr/share/pixmaps",
+]
+
+def _tmpfs_extract_root(appimage_path: Path) -> Optional[str]:
+    """
+    Pick a RAM-backed parent for the extraction directory when it safely fits.
+
+    Args:
+        appimage_path: Path to the AppImage file about to be extracted
+
+    Returns:
+        '/dev/shm' if it is writable with enough free space, else None
+        (meaning: use the default temporary directory)
+    """
+    shm = "/dev/shm"
+    if not (os.path.isdir(shm) and os.access(shm, os.W_OK)):
+        return None
+
+    try:
+        stats = os.statvfs(shm)
+        free_bytes = stats.f_bavail * stats.f_frsize
+        appimage_size = appimage_path.stat().st_size
+    except OSError:
+        return None
+
+    # Extracted contents can be larger than the compressed image, so only
+    # use RAM when there's at least twice the image size free
+    if free_bytes < 2 * appimage_size:
+        return None
+    return shm
+
+def _elf_squashfs_offset(appimage_path: Path) -> Optional[int]:
+    """
+    Compute the squashfs offset of a type-2 AppImage from its ELF header.
+
+    The squashfs starts right after the runtime's section headers, i.e. at
+    e_shoff + e_shnum * e_shentsize.
+
+    Args:
+        appimage_path: Absolute path to the AppImage file
+
+    Returns:
+        Byte offset of the embedded squashfs, or None if the header doesn't
+        parse or the squashfs magic isn't where it should be
+    """
+    try:
+        with open(appimage_path, 'rb') as f:
+            header = f.read(64)
+            if len(header) < 52 or not header.startswith(b'\x7fELF'):
+                return None
+
+            ei_class = header[4]  # 1 = 32-bit, 2 = 64-bit
+            ei_data = header[5]   # 1 = little-endian, 2 = big-endian
+            if ei_class not in (1, 2) or ei_data not in (1, 2):
+                return None
+            endian = '<' if ei_data == 1 else '>'
+
+            if ei_class == 2:
+                (e_shoff,) = struct.unpack_from(endian + 'Q', header, 0x28)
+                e_shentsize, e_shnum = struct.unpack_from(endian + 'HH', header, 0x3A)
+            else:
+                (e_shoff,) = struct.unpack_from(endian + 'I', header, 0x20)
+                e_shentsize, e_shnum = struct.unpack_from(endian + 'HH', header, 0x2E)
+
+            offset = e_shoff + e_shentsize * e_shnum
+
+            # Sanity check: a type-2 AppImage has the squashfs magic there
+            f.seek(offset)
+            if f.read(4) != b'hsqs':
+                return None
+            return offset
+    except (OSError, struct.error):
+        return None
+
+def _appimage_offset(appimage_path: Path) -> Optional[int]:
+    """
+    Determine the squashfs offset inside a type-2 AppImage.
+
+    Args:
+        appimage_path: Absolute path to the AppImage file
+
+    Returns:
+        Byte offset of the embedded squashfs, or None if it can't be determined
+    """
+    # Reading the ELF header costs two small reads; asking the AppImage via
+    # --appimage-offset costs a fork/exec of its runtime. Try cheap first
+    offset = _elf_squashfs_offset(appimage_path)
+    if offset is not None:
+        return offset
+
+    try:
+        result = subprocess.run(
+            [str(appimage_path), "--appimage-offset"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=True,
+            text=True
+        )
+        return int(result.stdout.strip())
+    except (OSError, subprocess.SubprocessError, ValueError):
+        return None
+
+def _extract_with_unsquashfs(appimage_path: Path, extract_dir: Path) -> bool:
+    """
+    Extract only the .desktop and icon entries with unsquashfs, if possible.
+
+    Args:
+        appimage_path: Absolute path to the AppImage file
+        extract_dir: Directory where contents will be extracted
+
+    Returns:
+        True if the targeted extraction succeeded, False to fall back
+    """
+    if shutil.which("unsquashfs") is None:
+        return False
+
+    offset = _appimage_offset(appimage_path)
+    if offset is None:
+        return False
+
+    try:
+        subprocess.run(
+            ["unsquashfs", "-no-progress", "-o", str(offset),
+             "-d", str(extract_dir / "squashfs-root"), str(appimage_path)]
+            + _UNSQUASHFS_INCLUDES,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+    return (extract_dir / "squashfs-root").is_dir()
 
 def extract_appimage(appimage_path: Path, extract_dir: Path) -> None:
     """
     Extract AppImage contents to specified directory.
-    
+
     Args:
         appimage_path: Path to the AppImage file
         extract_dir: Directory where contents will be extracted
-    
+
     Raises:
         Exception: If extraction fails
     """
     # Convert to absolute path to ensure it's found regardless of working directory
     absolute_appimage_path = appimage_path.absolute()
-    
+
+    # Prefer a targeted unsquashfs run that pulls out only the .desktop and
+    # icon files instead of dumping the entire image to disk
+    if _extract_with_unsquashfs(absolute_appimage_path, extract_dir):
+        return
+
     try:
         # Use a context manager for better resource handling
         subprocess.run(
@@ -38,27 +287,75 @@ def extract_appimage(appimage_path: Path, extract_dir: Path) -> None:
     except FileNotFoundError:
         raise Exception(f"AppImage file not found at: {absolute_appimage_path}")
 
+def _copy_file(src: Path, dst: Path) -> None:
+    """
+    Copy a file, preferring an in-kernel copy over userspace buffering.
+
+    Args:
+        src: Path to the source file
+        dst: Path to the destination file
+    """
+    try:
+        with open(src, 'rb') as infile, open(dst, 'wb') as outfile:
+            # copy_file_range stays in the kernel and can reflink on
+            # filesystems that support it; loop until the source is drained
+            while os.copy_file_range(infile.fileno(), outfile.fileno(), 2**30):
+                pass
+        shutil.copystat(src, dst)
+    except (AttributeError, OSError):
+        # Not available (non-Linux, old kernel, cross-device) - copy normally
+        shutil.copy2(src, dst)
+
+def _desktop_file_in_dir(directory: Path) -> Optional[Path]:
+    """
+    Return a .desktop file directly inside a directory, if any.
+
+    Args:
+        directory: Directory to check (need not exist)
+
+    Returns:
+        Path to a desktop file or None if not found
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith('.desktop') and entry.is_file():
+                    return Path(entry.path)
+    except OSError:
+        pass
+    return None
+
 def get_desktop_file(extract_dir: Path) -> Optional[Path]:
     """
     Find the .desktop file in the extracted AppImage.
-    
+
     Args:
         extract_dir: Directory containing extracted AppImage
-        
+
     Returns:
         Path to the desktop file or None if not found
     """
+    squashfs_root = extract_dir / "squashfs-root"
+
+    # Desktop files nearly always sit in the standard applications
+    # directories or the squashfs root; probe those before recursing
+    for location in ["usr/share/applications", "usr/local/share/applications", ""]:
+        desktop_file = _desktop_file_in_dir(squashfs_root / location)
+        if desktop_file:
+            return desktop_file
+
+    # Fall back to a full recursive search for unusual layouts
     desktop_files = list(extract_dir.glob("squashfs-root/**/*.desktop"))
-    
+
     if not desktop_files:
         return None
-        
+
     # If multiple desktop files exist, prefer ones in standard locations
     for location in ["usr/share/applications", "usr/local/share/applications"]:
         for file in desktop_files:
             if location in str(file):
                 return file
-    
+
     # Otherwise return the first one found
     return desktop_files[0]
 
@@ -73,118 +370,172 @@ def parse_icon_name(desktop_file: Path) -> Optional[str]:
         Icon name or None if not found
     """
     try:
-        with open(desktop_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.startswith('Icon='):
-                    return line.strip().split('=', 1)[1]  # Allow for = in icon names
-    except UnicodeDecodeError:
-        # Try with latin-1 encoding if utf-8 fails
-        try:
-            with open(desktop_file, 'r', encoding='latin-1') as f:
-                for line in f:
-                    if line.startswith('Icon='):
-                        return line.strip().split('=', 1)[1]
-        except Exception:
-            pass
+        data = desktop_file.read_bytes()
     except Exception:
-        pass
-            
-    return None
+        return None
+
+    # Scan the raw bytes for the Icon= line and only decode the short value;
+    # this avoids decoding the whole file and any encoding-fallback re-read
+    if data.startswith(b'Icon='):
+        start = len(b'Icon=')
+    else:
+        idx = data.find(b'\nIcon=')
+        if idx == -1:
+            return None
+        start = idx + len(b'\nIcon=')
+
+    end = data.find(b'\n', start)
+    if end == -1:
+        end = len(data)
+
+    value = data[start:end].strip()  # Allow for = in icon names
+    if not value:
+        return None
+    # surrogateescape round-trips non-utf-8 bytes losslessly, so an icon name
+    # in a legacy encoding still matches the on-disk filename
+    return value.decode('utf-8', errors='surrogateescape')
+
+def _scan_icon_tree(root: Path, squashfs_root: Path, skip: Tuple[str, ...] = ()) -> Dict[str, List[Tuple[int, int, int, int, Path]]]:
+    """
+    Walk a directory tree once and index every image file found.
+
+    Args:
+        root: Directory to walk
+        squashfs_root: Root of the extracted AppImage (used for ranking)
+        skip: Directory paths to leave out of the walk
+
+    Returns:
+        Dict mapping lowercased file stem to a list of
+        (theme_rank, size_rank, ext_rank, -file_size, path) tuples,
+        where lower is better
+    """
+    index: Dict[str, List[Tuple[int, int, int, int, Path]]] = {}
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.path not in skip:
+                            stack.append(entry.path)
+                        continue
+                    # Follow symlinks here: icon themes commonly symlink
+                    # between sizes or to .DirIcon
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+
+                stem, ext = os.path.splitext(entry.name)
+                ext_rank = _EXT_RANKS.get(ext.lower())
+                if ext_rank is None:
+                    continue
+
+                # Rank by the themed directory the icon lives in; icons outside
+                # the known theme directories (pixmaps, squashfs root, ...) sort last
+                rel_path = os.path.relpath(entry.path, str(squashfs_root))
+                match = _ICON_DIR_RE.search(rel_path)
+                if match:
+                    theme_rank = _THEME_RANKS.get(match.group(1), len(_THEME_RANKS))
+                    size_rank = _SIZE_RANKS.get(match.group(2), len(_SIZE_RANKS))
+                else:
+                    theme_rank = len(_THEME_RANKS)
+                    size_rank = len(_SIZE_RANKS)
+
+                # DirEntry.stat reuses what scandir already fetched where the
+                # platform allows, so ties (e.g. duplicate PNGs) break toward
+                # the largest file without a syscall per candidate
+                try:
+                    file_size = entry.stat().st_size
+                except OSError:
+                    file_size = 0
+
+                candidate = (theme_rank, size_rank, ext_rank, -file_size, Path(entry.path))
+                index.setdefault(stem.lower(), []).append(candidate)
+
+    return index
 
 def find_best_icon(extract_dir: Path, icon_name: str) -> Optional[Tuple[Path, str]]:
     """
     Find the best available icon file.
-    
+
     Args:
         extract_dir: Directory containing extracted AppImage
         icon_name: Name of the icon to find
-        
+
     Returns:
         Tuple of (icon_path, extension) or None if not found
     """
     squashfs_root = extract_dir / "squashfs-root"
-    
-    # Prioritized list of icon sizes (from best to acceptable)
-    prioritized_sizes = ["scalable", "512x512", "256x256", "128x128", "64x64", "48x48", "32x32", "16x16"]
-    
-    # Common icon locations with priority order
-    icon_dirs: List[Path] = []
-    
-    # Standard icon directories
-    for theme in ["hicolor", "Humanity", "breeze", "Adwaita"]:
-        for size in prioritized_sizes:
-            icon_dirs.extend([
-                squashfs_root / f"usr/share/icons/{theme}/{size}/apps",
-                squashfs_root / f"usr/share/icons/{theme}/{size}/mimetypes",
-            ])
-    
-    # Additional locations
-    icon_dirs.extend([
-        squashfs_root / "usr/share/pixmaps",
-        squashfs_root / "usr/share/icons",
-        squashfs_root / ".DirIcon",
-        squashfs_root
-    ])
-
-    # First, look for exact matches with preferred formats
-    for icon_dir in icon_dirs:
-        if not icon_dir.exists() or not icon_dir.is_dir():
-            continue
 
-        # Check for SVG first (vector is preferred)
-        svg_candidates = list(icon_dir.glob(f"{icon_name}.svg"))
-        if svg_candidates:
-            return (svg_candidates[0], '.svg')
-
-        # Then check for PNG
-        png_candidates = list(icon_dir.glob(f"{icon_name}.png"))
-        if png_candidates:
-            # If multiple PNGs exist, find the largest one
-            if len(png_candidates) > 1:
-                largest_png = max(png_candidates, key=lambda p: p.stat().st_size)
-                return (largest_png, '.png')
-            return (png_candidates[0], '.png')
-            
-        # Then check for other image formats
-        for ext in ['.jpg', '.jpeg', '.ico']:
-            candidates = list(icon_dir.glob(f"{icon_name}{ext}"))
-            if candidates:
-                return (candidates[0], ext)
+    # Index every image file in a single traversal instead of globbing each
+    # candidate directory separately. The walk is pure I/O (readdir/stat), so
+    # when there are several theme subtrees, scan them in parallel threads
+    icons_dir = squashfs_root / "usr/share/icons"
+    theme_dirs: List[str] = []
+    try:
+        with os.scandir(icons_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        theme_dirs.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
 
-    # If no exact matches, look for similar names (case-insensitive)
+    if len(theme_dirs) >= 4:
+        index: Dict[str, List[Tuple[int, int, int, int, Path]]] = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(theme_dirs))) as executor:
+            futures = [
+                executor.submit(_scan_icon_tree, Path(theme_dir), squashfs_root)
+                for theme_dir in theme_dirs
+            ]
+            # Scan everything outside the theme trees on one more worker
+            futures.append(
+                executor.submit(_scan_icon_tree, squashfs_root, squashfs_root, skip=tuple(theme_dirs))
+            )
+            for future in futures:
+                for stem, candidates in future.result().items():
+                    index.setdefault(stem, []).extend(candidates)
+    else:
+        index = _scan_icon_tree(squashfs_root, squashfs_root)
     icon_name_lower = icon_name.lower()
-    for icon_dir in icon_dirs:
-        if not icon_dir.exists() or not icon_dir.is_dir():
-            continue
-
-        # Look for SVGs first
-        svg_candidates = list(icon_dir.glob("*.svg"))
-        for svg in svg_candidates:
-            if icon_name_lower in svg.stem.lower():
-                return (svg, '.svg')
 
-        # Then look for PNGs
-        png_candidates = list(icon_dir.glob("*.png"))
-        matching_pngs = [p for p in png_candidates if icon_name_lower in p.stem.lower()]
-        if matching_pngs:
-            largest_png = max(matching_pngs, key=lambda p: p.stat().st_size)
-            return (largest_png, '.png')
-
-    # Check if .DirIcon exists and is an image
+    # Score every exact and similar-name (case-insensitive) match in one pass:
+    # an exact stem match outranks a substring match, then the theme, size,
+    # extension, and file-size ranks from the index break ties
+    candidates = [
+        (0 if stem == icon_name_lower else 1,) + candidate
+        for stem, stem_candidates in index.items()
+        if icon_name_lower in stem
+        for candidate in stem_candidates
+    ]
+    if candidates:
+        best_path = min(candidates)[-1]
+        return (best_path, best_path.suffix.lower())
+
+    # Check if .DirIcon is an image; a failed open covers the missing-file
+    # case, so no separate exists()/is_file() stats are needed
     diricon = squashfs_root / ".DirIcon"
-    if diricon.exists() and diricon.is_file():
-        # Try to determine file type from contents
+    # Determine file type from the magic bytes with a single dict lookup
+    try:
+        fd = os.open(str(diricon), os.O_RDONLY)
         try:
-            with open(diricon, 'rb') as f:
-                magic_number = f.read(8)  # Read a bit more for better detection
-                if magic_number.startswith(b'\x89PNG'):
-                    return (diricon, '.png')
-                elif b'<?xml' in magic_number or b'<svg' in magic_number:
-                    return (diricon, '.svg')
-                elif magic_number.startswith(b'\xff\xd8'):  # JPEG signature
-                    return (diricon, '.jpg')
-        except Exception:
-            pass  # If we can't read the file, just skip it
+            header = os.read(fd, 16)
+        finally:
+            os.close(fd)
+    except Exception:
+        pass  # If we can't read the file, just skip it
+    else:
+        extension = _MAGIC.get(header[:4])
+        if extension:
+            return (diricon, extension)
 
     return None
 
@@ -200,29 +551,17 @@ def clean_app_name(appimage_path: str) -> str:
     """
     name = Path(appimage_path).stem # Start with original case stem
 
-    # Define patterns to remove
-    # More comprehensive version pattern
-    version_pattern = r'[-_.]?v?\d+(\.\d+)+([-_.]?\w+)*'
-    # Date pattern (YYYYMMDD, YYYY-MM-DD, YYYY.MM.DD)
-    date_pattern = r'[-_.]?\d{4}[-_.]?\d{2}[-_.]?\d{2}'
-    # Expanded pattern for architecture, OS, distribution, type, build tags etc.
-    noise_pattern = (
-        r'[-_.](x86[_-]?64|amd64|x64|i\d86|i386|i686|armv\dl|armhf|arm64|aarch64|'
-        r'linux|macos|windows|win32|win64|AppImage|portable|deb|rpm|snap|flatpak|'
-        r'setup|installer|bundle|build|release|stable|beta|alpha|rc\d*)\b'
-    )
-
     # Apply patterns sequentially - order can matter
     # Remove noise patterns first (case-insensitive)
-    name = re.sub(noise_pattern, '', name, flags=re.IGNORECASE)
+    name = _NOISE_RE.sub('', name)
     # Then remove version strings (case-insensitive for potential 'v' or suffixes)
-    name = re.sub(version_pattern, '', name, flags=re.IGNORECASE)
+    name = _VERSION_RE.sub('', name)
     # Then remove date strings (case doesn't matter)
-    name = re.sub(date_pattern, '', name)
+    name = _DATE_RE.sub('', name)
 
     # Final cleanup: only keep letters (case preserved) and digits, replace others with hyphens
     # Replace sequences of non-alphanumeric chars with a single hyphen
-    name = re.sub(r'[^a-zA-Z0-9]+', '-', name)
+    name = _NONALNUM_RE.sub('-', name)
     # Remove leading/trailing hyphens that might have been introduced or left over
     name = name.strip('-')
 
@@ -230,7 +569,7 @@ def clean_app_name(appimage_path: str) -> str:
     if not name or name == '-':
         # Fallback to the original stem, minimally cleaned (alphanumeric+hyphen, case preserved)
         fallback_name = Path(appimage_path).stem
-        fallback_name = re.sub(r'[^a-zA-Z0-9]+', '-', fallback_name)
+        fallback_name = _NONALNUM_RE.sub('-', fallback_name)
         fallback_name = fallback_name.strip('-')
         # If even fallback is empty, use a default name (lowercase is fine here)
         return fallback_name if fallback_name else 'appimage-icon'
@@ -256,14 +595,32 @@ def create_backup(file_path: Path) -> Optional[Path]:
     extension = file_path.suffix
     backup_path = file_path.with_name(f"{stem}.bak{extension}")
     
-    # If backup already exists, use a numbered backup
+    # If backup already exists, use a numbered backup. One directory listing
+    # replaces a stat probe per candidate name
+    try:
+        with os.scandir(file_path.parent) as entries:
+            existing = {entry.name for entry in entries}
+    except OSError:
+        existing = set()
+
     counter = 1
-    original_backup_path = backup_path
-    while backup_path.exists():
+    while backup_path.name in existing:
         backup_path = file_path.with_name(f"{stem}.bak.{counter}{extension}")
         counter += 1
-    
-    shutil.copy2(file_path, backup_path)
+
+    # The listing only picked a likely-free name; O_CREAT|O_EXCL claims it
+    # atomically, so a concurrent run can't grab the same backup name
+    while True:
+        try:
+            fd = os.open(str(backup_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            break
+        except FileExistsError:
+            backup_path = file_path.with_name(f"{stem}.bak.{counter}{extension}")
+            counter += 1
+
+    with open(file_path, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    shutil.copystat(file_path, backup_path)
     return backup_path
 
 def create_desktop_file(original_desktop_path: Path, clean_name: str, icon_extension: str, output_dir: Path) -> None:
@@ -284,61 +641,51 @@ def create_desktop_file(original_desktop_path: Path, clean_name: str, icon_exten
     if backup_path:
         print(f"Created backup of existing desktop file at: {backup_path}")
     
-    # Get the full home directory path
-    home_dir = str(Path.home())
-    appimage_dir = os.path.join(home_dir, "AppImage")
-    
-    new_icon_entry = f"Icon={appimage_dir}/{clean_name}{icon_extension}"
-    new_exec_entry = f"Exec={appimage_dir}/_launch_appimage {clean_name} %U"
+    new_icon_entry = f"Icon={_APPIMAGE_DIR_STR}/{clean_name}{icon_extension}"
+    new_exec_entry = f"Exec={_APPIMAGE_DIR_STR}/_launch_appimage {clean_name} %U"
 
-    
     try:
-        # Try with utf-8 encoding first
-        with open(original_desktop_path, 'r', encoding='utf-8') as infile, \
-             open(new_desktop_path, 'w', encoding='utf-8') as outfile:
-            _process_desktop_file(infile, outfile, new_icon_entry, new_exec_entry)
-            
+        # Read once, transform in memory, write once; staying in bytes also
+        # preserves the original encoding without any decode-retry dance
+        data = original_desktop_path.read_bytes()
+        new_desktop_path.write_bytes(
+            _process_desktop_file(data, new_icon_entry.encode('utf-8'), new_exec_entry.encode('utf-8'))
+        )
+
         print(f".desktop file created at: {new_desktop_path}")
-        
-    except UnicodeDecodeError:
-        # If utf-8 fails, try with latin-1
-        try:
-            with open(original_desktop_path, 'r', encoding='latin-1') as infile, \
-                 open(new_desktop_path, 'w', encoding='utf-8') as outfile:
-                _process_desktop_file(infile, outfile, new_icon_entry, new_exec_entry)
-                
-            print(f".desktop file created at: {new_desktop_path}")
-            
-        except OSError as e:
-            print(f"Error creating .desktop file {new_desktop_path}: {e}")
+
     except OSError as e:
         print(f"Error creating .desktop file {new_desktop_path}: {e}")
 
-def _process_desktop_file(infile, outfile, new_icon_entry: str, new_exec_entry: str) -> None:
+def _process_desktop_file(data: bytes, new_icon_entry: bytes, new_exec_entry: bytes) -> bytes:
     """
     Helper function to process desktop file contents.
-    
+
     Args:
-        infile: Input file object
-        outfile: Output file object
+        data: Raw contents of the original desktop file
         new_icon_entry: New Icon entry
         new_exec_entry: New Exec entry
+
+    Returns:
+        Transformed desktop file contents
     """
+    out_lines: List[bytes] = []
     in_action_section = False
-    
-    for line in infile:
+
+    for line in data.splitlines():
         stripped_line = line.strip()
+        match = _LINE_RE.match(stripped_line)
+        kind = match.lastgroup if match else None
 
         # Check for section headers
-        if stripped_line.startswith('[') and stripped_line.endswith(']'):
-            section_name = stripped_line[1:-1]
+        if kind == 'header':
             # Check if it's a Desktop Action section (case-insensitive)
-            if "desktop action" in section_name.lower():
+            if b"desktop action" in match.group('header').lower():
                 in_action_section = True
                 continue # Skip the action section header itself
             else:
                 in_action_section = False
-                outfile.write(line) # Write other section headers
+                out_lines.append(line) # Keep other section headers
                 continue # Process next line
 
         # Skip lines within an action section
@@ -346,19 +693,17 @@ def _process_desktop_file(infile, outfile, new_icon_entry: str, new_exec_entry:
             continue
 
         # Process lines outside action sections
-        if stripped_line.startswith('Icon='):
-            outfile.write(new_icon_entry + '\n')
-        elif stripped_line.startswith('Exec='):
-            outfile.write(new_exec_entry + '\n')
-        elif stripped_line.startswith('X-AppImage-Version='):
-            pass # Skip this line
-        elif stripped_line.startswith('Actions='):
-            pass # Skip this line
-        elif stripped_line.startswith('TryExec='):
+        if kind == 'icon':
+            out_lines.append(new_icon_entry)
+        elif kind == 'exec':
+            out_lines.append(new_exec_entry)
+        elif kind == 'skip':
             pass # Skip this line
         else:
-            # Write any other line that isn't skipped
-            outfile.write(line)
+            # Keep any other line that isn't skipped
+            out_lines.append(line)
+
+    return b'\n'.join(out_lines) + b'\n'
 
 def main():
     if len(sys.argv) != 2:
@@ -370,8 +715,9 @@ def main():
         print(f"Error: File {appimage_path} not found")
         sys.exit(1)
 
-    # Create temporary directory for extraction
-    with tempfile.TemporaryDirectory() as temp_dir:
+    # Create temporary directory for extraction, on tmpfs when it fits so the
+    # extracted data never touches the disk
+    with tempfile.TemporaryDirectory(dir=_tmpfs_extract_root(appimage_path)) as temp_dir:
         temp_path = Path(temp_dir)
 
         try:
@@ -409,17 +755,15 @@ def main():
                 print(f"Created backup of existing icon at: {backup_path}")
 
             # Copy icon to current directory
-            shutil.copy2(icon_path, output_icon_path)
+            _copy_file(icon_path, output_icon_path)
             print(f"Icon extracted to: {output_icon_path}")
 
             # Create the .desktop file
             create_desktop_file(desktop_file, clean_name, extension, Path.cwd())
             
             # Check if we're already in the AppImage directory
-            home_dir = str(Path.home())
-            appimage_dir = Path(os.path.join(home_dir, "AppImage"))
             current_dir = Path.cwd().resolve()
-            already_in_appimage_dir = current_dir == appimage_dir
+            already_in_appimage_dir = current_dir == _APPIMAGE_DIR
 
             # Combined reminder for complete setup
             desktop_file_name = f"AppImage-{clean_name}.desktop"